@@ -14,14 +14,13 @@
 """Tests for image classifier."""
 
 import enum
+import functools
 import os
-from unittest import mock
+from typing import Sequence
 
 from absl.testing import absltest
 from absl.testing import parameterized
 
-import numpy as np
-
 from mediapipe.python._framework_bindings import image
 from mediapipe.tasks.python.components.containers import category
 from mediapipe.tasks.python.components.containers import classifications as classifications_module
@@ -46,6 +45,7 @@ _RUNNING_MODE = vision_task_running_mode.VisionTaskRunningMode
 
 _MODEL_FILE = 'mobilenet_v2_1.0_224.tflite'
 _IMAGE_FILE = 'burger.jpg'
+_MULTI_OBJECTS_IMAGE_FILE = 'multi_objects.jpg'
 _ALLOW_LIST = ['cheeseburger', 'guacamole']
 _DENY_LIST = ['cheeseburger']
 _SCORE_THRESHOLD = 0.5
@@ -53,68 +53,101 @@ _MAX_RESULTS = 3
 _TEST_DATA_DIR = 'mediapipe/tasks/testdata/vision'
 
 
-def _generate_empty_results(timestamp_ms: int) -> _ClassificationResult:
+_BURGER_CATEGORIES = (
+    _Category(
+        index=934, score=0.793959, display_name='',
+        category_name='cheeseburger'),
+    _Category(
+        index=932, score=0.0273929, display_name='', category_name='bagel'),
+    _Category(
+        index=925, score=0.0193408, display_name='',
+        category_name='guacamole'),
+    _Category(
+        index=963, score=0.00632786, display_name='',
+        category_name='meat loaf'),
+)
+_SOCCER_BALL_CATEGORIES = (
+    _Category(
+        index=806, score=0.996527, display_name='',
+        category_name='soccer ball'),
+)
+
+
+def _generate_results(categories: Sequence[_Category],
+                      timestamp_ms: int) -> _ClassificationResult:
   return _ClassificationResult(classifications=[
       _Classifications(
           entries=[
-              _ClassificationEntry(categories=[], timestamp_ms=timestamp_ms)
+              _ClassificationEntry(
+                  categories=list(categories), timestamp_ms=timestamp_ms)
           ],
           head_index=0,
           head_name='probability')
   ])
 
 
+def _generate_empty_results(timestamp_ms: int) -> _ClassificationResult:
+  return _generate_results((), timestamp_ms)
+
+
 def _generate_burger_results(timestamp_ms: int) -> _ClassificationResult:
-  return _ClassificationResult(classifications=[
-      _Classifications(
-          entries=[
-              _ClassificationEntry(
-                  categories=[
-                      _Category(
-                          index=934,
-                          score=0.793959,
-                          display_name='',
-                          category_name='cheeseburger'),
-                      _Category(
-                          index=932,
-                          score=0.0273929,
-                          display_name='',
-                          category_name='bagel'),
-                      _Category(
-                          index=925,
-                          score=0.0193408,
-                          display_name='',
-                          category_name='guacamole'),
-                      _Category(
-                          index=963,
-                          score=0.00632786,
-                          display_name='',
-                          category_name='meat loaf')
-                  ],
-                  timestamp_ms=timestamp_ms)
-          ],
-          head_index=0,
-          head_name='probability')
-  ])
+  return _generate_results(_BURGER_CATEGORIES, timestamp_ms)
 
 
 def _generate_soccer_ball_results(timestamp_ms: int) -> _ClassificationResult:
-  return _ClassificationResult(classifications=[
-      _Classifications(
-          entries=[
-              _ClassificationEntry(
-                  categories=[
-                      _Category(
-                          index=806,
-                          score=0.996527,
-                          display_name='',
-                          category_name='soccer ball')
-                  ],
-                  timestamp_ms=timestamp_ms)
-          ],
-          head_index=0,
-          head_name='probability')
-  ])
+  return _generate_results(_SOCCER_BALL_CATEGORIES, timestamp_ms)
+
+
+# Shared by the test parameters that never modify the expected result.
+_BURGER_RESULT_0 = _generate_burger_results(0)
+
+
+def _noop_result_callback(unused_result: _ClassificationResult,
+                          unused_output_image: _Image,
+                          unused_timestamp_ms: int):
+  """Result callback for the tests that never check the results."""
+
+
+@functools.lru_cache(maxsize=None)
+def _load_test_image(file_name: str) -> _Image:
+  """Decodes a test image on first use and reuses it afterwards."""
+  return _Image.create_from_file(
+      test_utils.get_test_data_path(os.path.join(_TEST_DATA_DIR, file_name)))
+
+
+# Classifiers created by `_cached_classifier`, closed in `tearDownClass`.
+_shared_classifiers = []
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_classifier(model_path,
+                       running_mode=_RUNNING_MODE.IMAGE,
+                       max_results=None,
+                       score_threshold=None,
+                       category_allowlist=None,
+                       category_denylist=None):
+  """Returns a classifier shared by all tests using the same options.
+
+  Only meant for tests that don't change the classifier state, e.g. tests that
+  classify a single image or only check the errors raised by the classifier.
+  Category lists must be given as tuples so that the arguments are hashable.
+  """
+  custom_classifier_options = _ClassifierOptions(
+      max_results=max_results,
+      score_threshold=score_threshold,
+      category_allowlist=(list(category_allowlist)
+                          if category_allowlist is not None else None),
+      category_denylist=(list(category_denylist)
+                         if category_denylist is not None else None))
+  options = _ImageClassifierOptions(
+      base_options=_BaseOptions(model_asset_path=model_path),
+      running_mode=running_mode,
+      classifier_options=custom_classifier_options,
+      result_callback=(_noop_result_callback
+                       if running_mode is _RUNNING_MODE.LIVE_STREAM else None))
+  classifier = _ImageClassifier.create_from_options(options)
+  _shared_classifiers.append(classifier)
+  return classifier
 
 
 class ModelFileType(enum.Enum):
@@ -124,13 +157,67 @@ class ModelFileType(enum.Enum):
 
 class ImageClassifierTest(parameterized.TestCase):
 
-  def setUp(self):
-    super().setUp()
-    self.test_image = _Image.create_from_file(
-        test_utils.get_test_data_path(
-            os.path.join(_TEST_DATA_DIR, _IMAGE_FILE)))
-    self.model_path = test_utils.get_test_data_path(
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    cls._model_path = test_utils.get_test_data_path(
         os.path.join(_TEST_DATA_DIR, _MODEL_FILE))
+    # Reads the model content once so that the tests creating classifiers from
+    # a model buffer don't have to re-read the file from disk.
+    with open(cls._model_path, 'rb') as f:
+      cls._model_bytes = f.read()
+    # Shared by the tests that load the model from its path. It is never
+    # modified: creating a classifier only reads it.
+    cls._base_options = _BaseOptions(model_asset_path=cls._model_path)
+
+  @classmethod
+  def tearDownClass(cls):
+    while _shared_classifiers:
+      _shared_classifiers.pop().close()
+    _cached_classifier.cache_clear()
+    super().tearDownClass()
+
+  @property
+  def model_path(self) -> str:
+    return self._model_path
+
+  # The test images are only decoded by the tests that use them.
+  @property
+  def test_image(self) -> _Image:
+    return _load_test_image(_IMAGE_FILE)
+
+  @property
+  def multi_objects_image(self) -> _Image:
+    return _load_test_image(_MULTI_OBJECTS_IMAGE_FILE)
+
+  def _assert_classification_result_equal(self, got: _ClassificationResult,
+                                          want: _ClassificationResult):
+    """Compares classification results without converting them to protos.
+
+    Scores are compared up to 5 decimal places, which matches the float
+    normalization done by `test_utils.assert_proto_equals`.
+
+    Args:
+      got: The classification result returned by the classifier.
+      want: The expected classification result.
+    """
+    self.assertLen(got.classifications, len(want.classifications))
+    for got_head, want_head in zip(got.classifications, want.classifications):
+      self.assertEqual(got_head.head_index, want_head.head_index)
+      self.assertEqual(got_head.head_name, want_head.head_name)
+      self.assertLen(got_head.entries, len(want_head.entries))
+      for got_entry, want_entry in zip(got_head.entries, want_head.entries):
+        self.assertEqual(got_entry.timestamp_ms, want_entry.timestamp_ms)
+        self.assertLen(got_entry.categories, len(want_entry.categories))
+        for got_category, want_category in zip(got_entry.categories,
+                                               want_entry.categories):
+          self.assertEqual(got_category.index, want_category.index)
+          self.assertEqual(got_category.category_name,
+                           want_category.category_name)
+          self.assertEqual(got_category.display_name,
+                           want_category.display_name)
+          self.assertAlmostEqual(
+              got_category.score, want_category.score, places=5)
 
   def test_create_from_file_succeeds_with_valid_model_path(self):
     # Creates with default option and valid model file successfully.
@@ -139,7 +226,7 @@ class ImageClassifierTest(parameterized.TestCase):
 
   def test_create_from_options_succeeds_with_valid_model_path(self):
     # Creates with options containing model file successfully.
-    base_options = _BaseOptions(model_asset_path=self.model_path)
+    base_options = self._base_options
     options = _ImageClassifierOptions(base_options=base_options)
     with _ImageClassifier.create_from_options(options) as classifier:
       self.assertIsInstance(classifier, _ImageClassifier)
@@ -156,23 +243,23 @@ class ImageClassifierTest(parameterized.TestCase):
 
   def test_create_from_options_succeeds_with_valid_model_content(self):
     # Creates with options containing model content successfully.
-    with open(self.model_path, 'rb') as f:
-      base_options = _BaseOptions(model_asset_buffer=f.read())
-      options = _ImageClassifierOptions(base_options=base_options)
-      classifier = _ImageClassifier.create_from_options(options)
+    base_options = _BaseOptions(model_asset_buffer=self._model_bytes)
+    options = _ImageClassifierOptions(base_options=base_options)
+    with _ImageClassifier.create_from_options(options) as classifier:
       self.assertIsInstance(classifier, _ImageClassifier)
 
   @parameterized.parameters(
-      (ModelFileType.FILE_NAME, 4, _generate_burger_results(0)),
-      (ModelFileType.FILE_CONTENT, 4, _generate_burger_results(0)))
+      (ModelFileType.FILE_NAME, 4, _BURGER_RESULT_0, True),
+      (ModelFileType.FILE_NAME, 4, _BURGER_RESULT_0, False),
+      (ModelFileType.FILE_CONTENT, 4, _BURGER_RESULT_0, True),
+      (ModelFileType.FILE_CONTENT, 4, _BURGER_RESULT_0, False))
   def test_classify(self, model_file_type, max_results,
-                    expected_classification_result):
+                    expected_classification_result, use_context):
     # Creates classifier.
     if model_file_type is ModelFileType.FILE_NAME:
-      base_options = _BaseOptions(model_asset_path=self.model_path)
+      base_options = self._base_options
     elif model_file_type is ModelFileType.FILE_CONTENT:
-      with open(self.model_path, 'rb') as f:
-        model_content = f.read()
+      model_content = self._model_bytes
       base_options = _BaseOptions(model_asset_buffer=model_content)
     else:
       # Should never happen
@@ -181,126 +268,88 @@ class ImageClassifierTest(parameterized.TestCase):
     custom_classifier_options = _ClassifierOptions(max_results=max_results)
     options = _ImageClassifierOptions(
         base_options=base_options, classifier_options=custom_classifier_options)
-    classifier = _ImageClassifier.create_from_options(options)
-
-    # Performs image classification on the input.
-    image_result = classifier.classify(self.test_image)
-    # Comparing results.
-    test_utils.assert_proto_equals(self, image_result.to_pb2(),
-                                   expected_classification_result.to_pb2())
-    # Closes the classifier explicitly when the classifier is not used in
-    # a context.
-    classifier.close()
-
-  @parameterized.parameters(
-      (ModelFileType.FILE_NAME, 4, _generate_burger_results(0)),
-      (ModelFileType.FILE_CONTENT, 4, _generate_burger_results(0)))
-  def test_classify_in_context(self, model_file_type, max_results,
-                               expected_classification_result):
-    if model_file_type is ModelFileType.FILE_NAME:
-      base_options = _BaseOptions(model_asset_path=self.model_path)
-    elif model_file_type is ModelFileType.FILE_CONTENT:
-      with open(self.model_path, 'rb') as f:
-        model_content = f.read()
-      base_options = _BaseOptions(model_asset_buffer=model_content)
+    if use_context:
+      with _ImageClassifier.create_from_options(options) as classifier:
+        # Performs image classification on the input.
+        image_result = classifier.classify(self.test_image)
     else:
-      # Should never happen
-      raise ValueError('model_file_type is invalid.')
-
-    custom_classifier_options = _ClassifierOptions(max_results=max_results)
-    options = _ImageClassifierOptions(
-        base_options=base_options, classifier_options=custom_classifier_options)
-    with _ImageClassifier.create_from_options(options) as classifier:
+      classifier = _ImageClassifier.create_from_options(options)
       # Performs image classification on the input.
       image_result = classifier.classify(self.test_image)
-      # Comparing results.
-      test_utils.assert_proto_equals(self, image_result.to_pb2(),
-                                     expected_classification_result.to_pb2())
+      # Closes the classifier explicitly when the classifier is not used in
+      # a context.
+      classifier.close()
+
+    # Comparing results.
+    self._assert_classification_result_equal(image_result,
+                                             expected_classification_result)
 
   def test_classify_succeeds_with_region_of_interest(self):
-    base_options = _BaseOptions(model_asset_path=self.model_path)
+    base_options = self._base_options
     custom_classifier_options = _ClassifierOptions(max_results=1)
     options = _ImageClassifierOptions(
         base_options=base_options, classifier_options=custom_classifier_options)
     with _ImageClassifier.create_from_options(options) as classifier:
-      # Load the test image.
-      test_image = _Image.create_from_file(
-          test_utils.get_test_data_path(
-              os.path.join(_TEST_DATA_DIR, 'multi_objects.jpg')))
+      test_image = self.multi_objects_image
       # NormalizedRect around the soccer ball.
       roi = _NormalizedRect(
           x_center=0.532, y_center=0.521, width=0.164, height=0.427)
       # Performs image classification on the input.
       image_result = classifier.classify(test_image, roi)
       # Comparing results.
-      test_utils.assert_proto_equals(self, image_result.to_pb2(),
-                                     _generate_soccer_ball_results(0).to_pb2())
+      self._assert_classification_result_equal(image_result,
+                                               _generate_soccer_ball_results(0))
 
   def test_score_threshold_option(self):
-    custom_classifier_options = _ClassifierOptions(
-        score_threshold=_SCORE_THRESHOLD)
-    options = _ImageClassifierOptions(
-        base_options=_BaseOptions(model_asset_path=self.model_path),
-        classifier_options=custom_classifier_options)
-    with _ImageClassifier.create_from_options(options) as classifier:
-      # Performs image classification on the input.
-      image_result = classifier.classify(self.test_image)
-      classifications = image_result.classifications
+    classifier = _cached_classifier(
+        self.model_path, score_threshold=_SCORE_THRESHOLD)
+    # Performs image classification on the input.
+    image_result = classifier.classify(self.test_image)
+    classifications = image_result.classifications
 
-      for classification in classifications:
-        for entry in classification.entries:
-          score = entry.categories[0].score
-          self.assertGreaterEqual(
-              score, _SCORE_THRESHOLD,
-              f'Classification with score lower than threshold found. '
-              f'{classification}')
+    for classification in classifications:
+      for entry in classification.entries:
+        score = entry.categories[0].score
+        self.assertGreaterEqual(
+            score, _SCORE_THRESHOLD,
+            f'Classification with score lower than threshold found. '
+            f'{classification}')
 
   def test_max_results_option(self):
-    custom_classifier_options = _ClassifierOptions(
-        score_threshold=_SCORE_THRESHOLD)
-    options = _ImageClassifierOptions(
-        base_options=_BaseOptions(model_asset_path=self.model_path),
-        classifier_options=custom_classifier_options)
-    with _ImageClassifier.create_from_options(options) as classifier:
-      # Performs image classification on the input.
-      image_result = classifier.classify(self.test_image)
-      categories = image_result.classifications[0].entries[0].categories
+    classifier = _cached_classifier(
+        self.model_path, score_threshold=_SCORE_THRESHOLD)
+    # Performs image classification on the input.
+    image_result = classifier.classify(self.test_image)
+    categories = image_result.classifications[0].entries[0].categories
 
-      self.assertLessEqual(
-          len(categories), _MAX_RESULTS, 'Too many results returned.')
+    self.assertLessEqual(
+        len(categories), _MAX_RESULTS, 'Too many results returned.')
 
   def test_allow_list_option(self):
-    custom_classifier_options = _ClassifierOptions(
-        category_allowlist=_ALLOW_LIST)
-    options = _ImageClassifierOptions(
-        base_options=_BaseOptions(model_asset_path=self.model_path),
-        classifier_options=custom_classifier_options)
-    with _ImageClassifier.create_from_options(options) as classifier:
-      # Performs image classification on the input.
-      image_result = classifier.classify(self.test_image)
-      classifications = image_result.classifications
+    classifier = _cached_classifier(
+        self.model_path, category_allowlist=tuple(_ALLOW_LIST))
+    # Performs image classification on the input.
+    image_result = classifier.classify(self.test_image)
+    classifications = image_result.classifications
 
-      for classification in classifications:
-        for entry in classification.entries:
-          label = entry.categories[0].category_name
-          self.assertIn(label, _ALLOW_LIST,
-                        f'Label {label} found but not in label allow list')
+    for classification in classifications:
+      for entry in classification.entries:
+        label = entry.categories[0].category_name
+        self.assertIn(label, _ALLOW_LIST,
+                      f'Label {label} found but not in label allow list')
 
   def test_deny_list_option(self):
-    custom_classifier_options = _ClassifierOptions(category_denylist=_DENY_LIST)
-    options = _ImageClassifierOptions(
-        base_options=_BaseOptions(model_asset_path=self.model_path),
-        classifier_options=custom_classifier_options)
-    with _ImageClassifier.create_from_options(options) as classifier:
-      # Performs image classification on the input.
-      image_result = classifier.classify(self.test_image)
-      classifications = image_result.classifications
+    classifier = _cached_classifier(
+        self.model_path, category_denylist=tuple(_DENY_LIST))
+    # Performs image classification on the input.
+    image_result = classifier.classify(self.test_image)
+    classifications = image_result.classifications
 
-      for classification in classifications:
-        for entry in classification.entries:
-          label = entry.categories[0].category_name
-          self.assertNotIn(label, _DENY_LIST,
-                           f'Label {label} found but in deny list.')
+    for classification in classifications:
+      for entry in classification.entries:
+        label = entry.categories[0].category_name
+        self.assertNotIn(label, _DENY_LIST,
+                         f'Label {label} found but in deny list.')
 
   def test_combined_allowlist_and_denylist(self):
     # Fails with combined allowlist and denylist
@@ -311,24 +360,20 @@ class ImageClassifierTest(parameterized.TestCase):
       custom_classifier_options = _ClassifierOptions(
           category_allowlist=['foo'], category_denylist=['bar'])
       options = _ImageClassifierOptions(
-          base_options=_BaseOptions(model_asset_path=self.model_path),
+          base_options=self._base_options,
           classifier_options=custom_classifier_options)
       with _ImageClassifier.create_from_options(options) as unused_classifier:
         pass
 
   def test_empty_classification_outputs(self):
-    custom_classifier_options = _ClassifierOptions(score_threshold=1)
-    options = _ImageClassifierOptions(
-        base_options=_BaseOptions(model_asset_path=self.model_path),
-        classifier_options=custom_classifier_options)
-    with _ImageClassifier.create_from_options(options) as classifier:
-      # Performs image classification on the input.
-      image_result = classifier.classify(self.test_image)
-      self.assertEmpty(image_result.classifications[0].entries[0].categories)
+    classifier = _cached_classifier(self.model_path, score_threshold=1)
+    # Performs image classification on the input.
+    image_result = classifier.classify(self.test_image)
+    self.assertEmpty(image_result.classifications[0].entries[0].categories)
 
   def test_missing_result_callback(self):
     options = _ImageClassifierOptions(
-        base_options=_BaseOptions(model_asset_path=self.model_path),
+        base_options=self._base_options,
         running_mode=_RUNNING_MODE.LIVE_STREAM)
     with self.assertRaisesRegex(ValueError,
                                 r'result callback must be provided'):
@@ -338,53 +383,36 @@ class ImageClassifierTest(parameterized.TestCase):
   @parameterized.parameters((_RUNNING_MODE.IMAGE), (_RUNNING_MODE.VIDEO))
   def test_illegal_result_callback(self, running_mode):
     options = _ImageClassifierOptions(
-        base_options=_BaseOptions(model_asset_path=self.model_path),
+        base_options=self._base_options,
         running_mode=running_mode,
-        result_callback=mock.MagicMock())
+        result_callback=_noop_result_callback)
     with self.assertRaisesRegex(ValueError,
                                 r'result callback should not be provided'):
       with _ImageClassifier.create_from_options(options) as unused_classifier:
         pass
 
-  def test_calling_classify_for_video_in_image_mode(self):
-    options = _ImageClassifierOptions(
-        base_options=_BaseOptions(model_asset_path=self.model_path),
-        running_mode=_RUNNING_MODE.IMAGE)
-    with _ImageClassifier.create_from_options(options) as classifier:
-      with self.assertRaisesRegex(ValueError,
-                                  r'not initialized with the video mode'):
-        classifier.classify_for_video(self.test_image, 0)
-
-  def test_calling_classify_async_in_image_mode(self):
-    options = _ImageClassifierOptions(
-        base_options=_BaseOptions(model_asset_path=self.model_path),
-        running_mode=_RUNNING_MODE.IMAGE)
-    with _ImageClassifier.create_from_options(options) as classifier:
-      with self.assertRaisesRegex(ValueError,
-                                  r'not initialized with the live stream mode'):
-        classifier.classify_async(self.test_image, 0)
-
-  def test_calling_classify_in_video_mode(self):
-    options = _ImageClassifierOptions(
-        base_options=_BaseOptions(model_asset_path=self.model_path),
-        running_mode=_RUNNING_MODE.VIDEO)
-    with _ImageClassifier.create_from_options(options) as classifier:
-      with self.assertRaisesRegex(ValueError,
-                                  r'not initialized with the image mode'):
-        classifier.classify(self.test_image)
-
-  def test_calling_classify_async_in_video_mode(self):
-    options = _ImageClassifierOptions(
-        base_options=_BaseOptions(model_asset_path=self.model_path),
-        running_mode=_RUNNING_MODE.VIDEO)
-    with _ImageClassifier.create_from_options(options) as classifier:
-      with self.assertRaisesRegex(ValueError,
-                                  r'not initialized with the live stream mode'):
-        classifier.classify_async(self.test_image, 0)
+  @parameterized.parameters(
+      (_RUNNING_MODE.IMAGE, 'classify_for_video', (0,),
+       r'not initialized with the video mode'),
+      (_RUNNING_MODE.IMAGE, 'classify_async', (0,),
+       r'not initialized with the live stream mode'),
+      (_RUNNING_MODE.VIDEO, 'classify', (),
+       r'not initialized with the image mode'),
+      (_RUNNING_MODE.VIDEO, 'classify_async', (0,),
+       r'not initialized with the live stream mode'),
+      (_RUNNING_MODE.LIVE_STREAM, 'classify', (),
+       r'not initialized with the image mode'),
+      (_RUNNING_MODE.LIVE_STREAM, 'classify_for_video', (0,),
+       r'not initialized with the video mode'))
+  def test_calling_method_in_wrong_mode(self, running_mode, method_name,
+                                        extra_args, expected_regex):
+    classifier = _cached_classifier(self.model_path, running_mode=running_mode)
+    with self.assertRaisesRegex(ValueError, expected_regex):
+      getattr(classifier, method_name)(self.test_image, *extra_args)
 
   def test_classify_for_video_with_out_of_order_timestamp(self):
     options = _ImageClassifierOptions(
-        base_options=_BaseOptions(model_asset_path=self.model_path),
+        base_options=self._base_options,
         running_mode=_RUNNING_MODE.VIDEO)
     with _ImageClassifier.create_from_options(options) as classifier:
       unused_result = classifier.classify_for_video(self.test_image, 1)
@@ -395,65 +423,52 @@ class ImageClassifierTest(parameterized.TestCase):
   def test_classify_for_video(self):
     custom_classifier_options = _ClassifierOptions(max_results=4)
     options = _ImageClassifierOptions(
-        base_options=_BaseOptions(model_asset_path=self.model_path),
+        base_options=self._base_options,
         running_mode=_RUNNING_MODE.VIDEO,
         classifier_options=custom_classifier_options)
+    # Only the timestamp differs between frames, so the expected result is
+    # built once and updated in place.
+    expected_result = _generate_burger_results(0)
     with _ImageClassifier.create_from_options(options) as classifier:
+      test_image = self.test_image
       for timestamp in range(0, 300, 30):
-        classification_result = classifier.classify_for_video(
-            self.test_image, timestamp)
-        test_utils.assert_proto_equals(
-            self, classification_result.to_pb2(),
-            _generate_burger_results(timestamp).to_pb2())
+        # Keeps checking the remaining frames if one of them fails.
+        with self.subTest(timestamp=timestamp):
+          classification_result = classifier.classify_for_video(
+              test_image, timestamp)
+          expected_result.classifications[0].entries[
+              0].timestamp_ms = timestamp
+          self._assert_classification_result_equal(classification_result,
+                                                   expected_result)
 
   def test_classify_for_video_succeeds_with_region_of_interest(self):
     custom_classifier_options = _ClassifierOptions(max_results=1)
     options = _ImageClassifierOptions(
-        base_options=_BaseOptions(model_asset_path=self.model_path),
+        base_options=self._base_options,
         running_mode=_RUNNING_MODE.VIDEO,
         classifier_options=custom_classifier_options)
     with _ImageClassifier.create_from_options(options) as classifier:
-      # Load the test image.
-      test_image = _Image.create_from_file(
-          test_utils.get_test_data_path(
-              os.path.join(_TEST_DATA_DIR, 'multi_objects.jpg')))
+      test_image = self.multi_objects_image
       # NormalizedRect around the soccer ball.
       roi = _NormalizedRect(
           x_center=0.532, y_center=0.521, width=0.164, height=0.427)
+      expected_result = _generate_soccer_ball_results(0)
       for timestamp in range(0, 300, 30):
-        classification_result = classifier.classify_for_video(
-            test_image, timestamp, roi)
-        test_utils.assert_proto_equals(
-            self, classification_result.to_pb2(),
-            _generate_soccer_ball_results(timestamp).to_pb2())
-
-  def test_calling_classify_in_live_stream_mode(self):
-    options = _ImageClassifierOptions(
-        base_options=_BaseOptions(model_asset_path=self.model_path),
-        running_mode=_RUNNING_MODE.LIVE_STREAM,
-        result_callback=mock.MagicMock())
-    with _ImageClassifier.create_from_options(options) as classifier:
-      with self.assertRaisesRegex(ValueError,
-                                  r'not initialized with the image mode'):
-        classifier.classify(self.test_image)
-
-  def test_calling_classify_for_video_in_live_stream_mode(self):
-    options = _ImageClassifierOptions(
-        base_options=_BaseOptions(model_asset_path=self.model_path),
-        running_mode=_RUNNING_MODE.LIVE_STREAM,
-        result_callback=mock.MagicMock())
-    with _ImageClassifier.create_from_options(options) as classifier:
-      with self.assertRaisesRegex(ValueError,
-                                  r'not initialized with the video mode'):
-        classifier.classify_for_video(self.test_image, 0)
+        with self.subTest(timestamp=timestamp):
+          classification_result = classifier.classify_for_video(
+              test_image, timestamp, roi)
+          expected_result.classifications[0].entries[
+              0].timestamp_ms = timestamp
+          self._assert_classification_result_equal(classification_result,
+                                                   expected_result)
 
   def test_classify_async_calls_with_illegal_timestamp(self):
     custom_classifier_options = _ClassifierOptions(max_results=4)
     options = _ImageClassifierOptions(
-        base_options=_BaseOptions(model_asset_path=self.model_path),
+        base_options=self._base_options,
         running_mode=_RUNNING_MODE.LIVE_STREAM,
         classifier_options=custom_classifier_options,
-        result_callback=mock.MagicMock())
+        result_callback=_noop_result_callback)
     with _ImageClassifier.create_from_options(options) as classifier:
       classifier.classify_async(self.test_image, 100)
       with self.assertRaisesRegex(
@@ -464,43 +479,49 @@ class ImageClassifierTest(parameterized.TestCase):
                             (1, _generate_empty_results))
   def test_classify_async_calls(self, threshold, expected_result_fn):
     observed_timestamp_ms = -1
+    expected_image = self.test_image.numpy_view()
+    expected_image_bytes = expected_image.tobytes()
+    # Only the timestamp differs between callbacks, so the expected result is
+    # built once and updated in place.
+    expected_result = expected_result_fn(0)
 
     def check_result(result: _ClassificationResult, output_image: _Image,
                      timestamp_ms: int):
-      test_utils.assert_proto_equals(self, result.to_pb2(),
-                                     expected_result_fn(timestamp_ms).to_pb2())
-      self.assertTrue(
-          np.array_equal(output_image.numpy_view(),
-                         self.test_image.numpy_view()))
+      expected_result.classifications[0].entries[0].timestamp_ms = timestamp_ms
+      self._assert_classification_result_equal(result, expected_result)
+      output_image_view = output_image.numpy_view()
+      self.assertEqual(output_image_view.shape, expected_image.shape)
+      self.assertEqual(output_image_view.dtype, expected_image.dtype)
+      self.assertEqual(output_image_view.tobytes(), expected_image_bytes)
       self.assertLess(observed_timestamp_ms, timestamp_ms)
       self.observed_timestamp_ms = timestamp_ms
 
     custom_classifier_options = _ClassifierOptions(
         max_results=4, score_threshold=threshold)
     options = _ImageClassifierOptions(
-        base_options=_BaseOptions(model_asset_path=self.model_path),
+        base_options=self._base_options,
         running_mode=_RUNNING_MODE.LIVE_STREAM,
         classifier_options=custom_classifier_options,
         result_callback=check_result)
     with _ImageClassifier.create_from_options(options) as classifier:
+      # Binds the method and the image once so the loop only submits frames.
+      classify_async = classifier.classify_async
+      test_image = self.test_image
       for timestamp in range(0, 300, 30):
-        classifier.classify_async(self.test_image, timestamp)
+        classify_async(test_image, timestamp)
 
   def test_classify_async_succeeds_with_region_of_interest(self):
-    # Load the test image.
-    test_image = _Image.create_from_file(
-        test_utils.get_test_data_path(
-            os.path.join(_TEST_DATA_DIR, 'multi_objects.jpg')))
+    test_image = self.multi_objects_image
     # NormalizedRect around the soccer ball.
     roi = _NormalizedRect(
         x_center=0.532, y_center=0.521, width=0.164, height=0.427)
     observed_timestamp_ms = -1
+    expected_result = _generate_soccer_ball_results(0)
 
     def check_result(result: _ClassificationResult, output_image: _Image,
                      timestamp_ms: int):
-      test_utils.assert_proto_equals(
-          self, result.to_pb2(),
-          _generate_soccer_ball_results(timestamp_ms).to_pb2())
+      expected_result.classifications[0].entries[0].timestamp_ms = timestamp_ms
+      self._assert_classification_result_equal(result, expected_result)
       self.assertEqual(output_image.width, test_image.width)
       self.assertEqual(output_image.height, test_image.height)
       self.assertLess(observed_timestamp_ms, timestamp_ms)
@@ -508,13 +529,14 @@ class ImageClassifierTest(parameterized.TestCase):
 
     custom_classifier_options = _ClassifierOptions(max_results=1)
     options = _ImageClassifierOptions(
-        base_options=_BaseOptions(model_asset_path=self.model_path),
+        base_options=self._base_options,
         running_mode=_RUNNING_MODE.LIVE_STREAM,
         classifier_options=custom_classifier_options,
         result_callback=check_result)
     with _ImageClassifier.create_from_options(options) as classifier:
+      classify_async = classifier.classify_async
       for timestamp in range(0, 300, 30):
-        classifier.classify_async(test_image, timestamp, roi)
+        classify_async(test_image, timestamp, roi)
 
 
 if __name__ == '__main__':